@@ -4,16 +4,27 @@ CLI router for the lit command.
 Routes commands:
 - lit commit → special flow with translation and Conventional Commits
 - All other commands → passthrough to git
+
+Only os and sys are imported at module level so that passthrough commands
+reach git before anything else is loaded.
 """
 
-import asyncio
+import os
 import sys
-from rich.console import Console
 
-from lit.commit_flow import run_commit_flow
-from lit.git_utils import passthrough_git_command
+_HELP_ARGS = ("--help", "-h", "help")
+
+
+def _get_console():
+    """
+    Create the rich console on demand.
+
+    rich is only imported for help output and the commit flow, so git
+    passthrough commands do not pay for it.
+    """
+    from rich.console import Console
 
-console = Console()
+    return Console()
 
 
 def main() -> None:
@@ -26,8 +37,12 @@ def main() -> None:
     """
     args = sys.argv[1:]
 
-    if not args or args[0] in ["--help", "-h", "help"]:
+    if args and args[0] != "commit" and args[0] not in _HELP_ARGS:
+        _passthrough(args)
+
+    if not args or args[0] in _HELP_ARGS:
         # No arguments or help requested: show help
+        console = _get_console()
         console.print("[cyan]lit[/cyan] - Type how you think, commit effortlessly.")
         console.print()
         console.print("Usage: [cyan]lit <git-command>[/cyan] or [cyan]lit commit -m \"message\"[/cyan]")
@@ -38,13 +53,29 @@ def main() -> None:
         console.print("  [cyan]lit commit -m \"message\"[/cyan] # AI-powered commit")
         sys.exit(0)
 
-    # Check if the first argument is 'commit'
-    if args[0] == "commit":
-        _handle_commit(args)
-    else:
-        # Passthrough to git
-        exit_code = passthrough_git_command()
-        sys.exit(exit_code)
+    _handle_commit(args)
+
+
+def _passthrough(args: list[str]) -> None:
+    """
+    Hand a non-commit command over to git. Never returns.
+
+    Arguments without glob characters are exec'd straight into git with no
+    further imports. Globs, Windows, and a missing git go through
+    passthrough_git_command(), which expands patterns and reports errors.
+
+    Args:
+        args: The command arguments.
+    """
+    if sys.platform != "win32" and not any("*" in arg or "?" in arg for arg in args):
+        try:
+            os.execvp("git", ["git", *args])
+        except FileNotFoundError:
+            pass
+
+    from lit.git_utils import passthrough_git_command
+
+    sys.exit(passthrough_git_command())
 
 
 def _handle_commit(args: list[str]) -> None:
@@ -68,15 +99,34 @@ def _handle_commit(args: list[str]) -> None:
             break
 
     if not message:
+        console = _get_console()
         console.print(
             "[red]Error:[/red] Commit requires a message. Use: [cyan]lit commit -m \"message\"[/cyan]",
             style="bold red",
         )
         sys.exit(1)
 
-    # Run the async commit flow
+    from lit.git_utils import start_repo_probe
+
+    # Start the repository check now so git runs while the commit flow's
+    # dependencies are imported
+    repo_probe = start_repo_probe()
+
+    import asyncio
+
+    from lit.commit_flow import run_commit_flow
+    from lit.lingo_utils import close_engine
+
+    console = _get_console()
+
+    # Run the async commit flow. One event loop serves both the flow and
+    # closing the shared Lingo engine it opened.
     try:
-        success = asyncio.run(run_commit_flow(message))
+        with asyncio.Runner() as runner:
+            try:
+                success = runner.run(run_commit_flow(message, repo_probe))
+            finally:
+                runner.run(close_engine())
         exit_code = 0 if success else 1
         sys.exit(exit_code)
     except KeyboardInterrupt:
@@ -10,17 +10,18 @@ Handles the full lifecycle of a special commit:
 """
 
 import asyncio
+import subprocess
 from typing import Optional
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.spinner import Spinner
-import questionary
 
 from lit.git_utils import (
+    collect_staged_diff,
     commit_with_message,
-    get_staged_diff,
-    get_staged_files,
+    finish_repo_probe,
+    format_diff_metadata,
+    get_compact_staged_diff,
+    get_staged_diff_summary,
     is_git_repo,
 )
 from lit.lingo_utils import (
@@ -31,6 +32,15 @@ from lit.lingo_utils import (
 
 console = Console()
 
+# Above any of these limits, a compact diff is sent to Lingo instead of the
+# full one.
+MAX_FULL_DIFF_FILES = 50
+MAX_FULL_DIFF_LINES = 20000
+# Also the hard cap on the size of the compact diff
+MAX_DIFF_BYTES = 1_000_000
+# Diffs larger than this are sent to Lingo as file/hunk metadata only
+DIFF_METADATA_THRESHOLD = 256 * 1024
+
 
 class CommitFlowError(Exception):
     """Custom exception for commit flow errors."""
@@ -38,7 +48,28 @@ class CommitFlowError(Exception):
     pass
 
 
-async def run_commit_flow(raw_message: str) -> bool:
+def _not_a_repo_error() -> CommitFlowError:
+    """Report that lit is not running inside a git repository."""
+    console.print(
+        "[red]Error:[/red] Not inside a git repository.",
+        style="bold red",
+    )
+    return CommitFlowError("Not in a git repository")
+
+
+def _git_missing_error() -> CommitFlowError:
+    """Report that git could not be started."""
+    console.print(
+        "[red]Error:[/red] git is not installed or not in PATH. "
+        "Please install git to use lit.",
+        style="bold red",
+    )
+    return CommitFlowError("git is not installed")
+
+
+async def run_commit_flow(
+    raw_message: str, repo_probe: Optional[subprocess.Popen] = None
+) -> bool:
     """
     Execute the full commit flow with translation and verification.
 
@@ -51,6 +82,8 @@ async def run_commit_flow(raw_message: str) -> bool:
 
     Args:
         raw_message: The raw commit message from user input.
+        repo_probe: A probe from start_repo_probe() started before the flow,
+            used instead of a separate repository check.
 
     Returns:
         bool: True if commit succeeded, False if cancelled.
@@ -58,26 +91,61 @@ async def run_commit_flow(raw_message: str) -> bool:
     Raises:
         CommitFlowError: If any critical step fails.
     """
+    import questionary
+
     try:
-        # Step 1: Check if inside a git repo
-        if not is_git_repo():
-            console.print(
-                "[red]Error:[/red] Not inside a git repository.",
-                style="bold red",
-            )
-            raise CommitFlowError("Not in a git repository")
+        # Step 1: Check the repository and size up the staged changes.
+        # Without a prestarted probe, the repository is only checked when
+        # git fails.
+        if repo_probe is not None and finish_repo_probe(repo_probe) is None:
+            raise _not_a_repo_error()
+
+        try:
+            files_changed, insertions, deletions = get_staged_diff_summary()
+        except FileNotFoundError as e:
+            raise _git_missing_error() from e
+        except RuntimeError as e:
+            if repo_probe is None and not is_git_repo():
+                raise _not_a_repo_error() from e
+            raise CommitFlowError(str(e)) from e
 
         # Step 2: Check if files are staged
-        staged_files = get_staged_files()
-        if not staged_files:
+        if not files_changed:
             console.print(
                 "[red]No staged files.[/red] Run [cyan]git add[/cyan] first.",
                 style="bold red",
             )
             raise CommitFlowError("No staged files")
 
-        # Step 3: Extract staged diff
-        staged_diff = get_staged_diff()
+        # Step 3: Extract staged diff, falling back to a compact form for
+        # changes too large to ship whole. Diffs above
+        # DIFF_METADATA_THRESHOLD are sent to Lingo as a summary that still
+        # covers every staged file; the fallback sees the diff itself.
+        try:
+            full_diff = None
+            if (
+                files_changed <= MAX_FULL_DIFF_FILES
+                and insertions + deletions <= MAX_FULL_DIFF_LINES
+            ):
+                full_diff = collect_staged_diff(MAX_DIFF_BYTES)
+
+            if full_diff is not None:
+                diff_bytes, deltas = full_diff
+                overview = None
+            else:
+                console.print(
+                    f"[yellow]Large change ({files_changed} files):[/yellow] "
+                    "sending a compact diff.",
+                )
+                diff_bytes, overview = get_compact_staged_diff(MAX_DIFF_BYTES)
+        except RuntimeError as e:
+            raise CommitFlowError(str(e)) from e
+
+        staged_diff = diff_bytes.decode("utf-8", errors="replace")
+        lingo_diff = staged_diff
+        if len(diff_bytes) > DIFF_METADATA_THRESHOLD:
+            lingo_diff = overview if overview is not None else format_diff_metadata(deltas)
+
         if not staged_diff:
             console.print(
                 "[yellow]Warning:[/yellow] Staged changes are empty.",
@@ -86,18 +154,18 @@ async def run_commit_flow(raw_message: str) -> bool:
 
         # Step 4: Translate using Lingo with spinner
         console.print()
-        commit = await _translate_with_spinner(raw_message, staged_diff)
+        commit = await _translate_with_spinner(raw_message, staged_diff, lingo_diff)
 
         # Step 5: Show preview
         _show_commit_preview(commit)
 
         # Step 6: Ask for confirmation
-        action = questionary.select(
+        action = await questionary.select(
             "Commit with this message?",
             choices=["✓ Accept", "✏ Edit manually", "✗ Cancel"],
             qmark="",
             pointer="→",
-        ).ask()
+        ).ask_async()
 
         if action is None or action.startswith("✗"):
             console.print("[yellow]Commit cancelled.[/yellow]")
@@ -133,26 +201,37 @@ async def run_commit_flow(raw_message: str) -> bool:
 
 
 async def _translate_with_spinner(
-    raw_message: str, staged_diff: str
+    raw_message: str, staged_diff: str, lingo_diff: Optional[str] = None
 ) -> ConventionalCommit:
     """
     Translate the commit message with a spinner showing progress.
 
-    Falls back to heuristic generation if SDK fails.
+    Falls back to heuristic generation if SDK fails. The fallback is
+    computed in a worker thread while the SDK call is in flight, so a
+    failed translation does not add its cost on top.
 
     Args:
         raw_message: The raw user message.
-        staged_diff: The git diff.
+        staged_diff: The git diff, used by the fallback.
+        lingo_diff: What to send to Lingo in place of the diff, e.g. a
+            summary of a large one. Defaults to staged_diff.
 
     Returns:
         ConventionalCommit: The generated commit.
     """
+    if lingo_diff is None:
+        lingo_diff = staged_diff
+
+    fallback_task = asyncio.create_task(
+        asyncio.to_thread(fallback_generate_commit, raw_message, staged_diff)
+    )
+
     with console.status(
         "[cyan]⟳[/cyan] Translating and analyzing via Lingo.dev...",
         spinner="dots",
     ) as status:
         try:
-            commit = await translate_commit_message(raw_message, staged_diff)
+            commit = await translate_commit_message(raw_message, lingo_diff)
             if commit:
                 return commit
             else:
@@ -161,7 +240,7 @@ async def _translate_with_spinner(
                     "Using fallback.",
                     style="bold yellow",
                 )
-                return fallback_generate_commit(raw_message, staged_diff)
+                return await fallback_task
 
         except (RuntimeError, ValueError) as e:
             console.print()
@@ -170,7 +249,11 @@ async def _translate_with_spinner(
                 style="bold yellow",
             )
             console.print("[yellow]Using heuristic generation as fallback...[/yellow]")
-            return fallback_generate_commit(raw_message, staged_diff)
+            return await fallback_task
+
+        finally:
+            if not fallback_task.done():
+                fallback_task.cancel()
 
 
 def _show_commit_preview(commit: ConventionalCommit) -> None:
@@ -180,6 +263,8 @@ def _show_commit_preview(commit: ConventionalCommit) -> None:
     Args:
         commit: The commit to preview.
     """
+    from rich.panel import Panel
+
     title, body = commit.format_message()
     preview_text = f"[bold cyan]{title}[/bold cyan]\n\n{body}"
 
@@ -204,17 +289,19 @@ async def _edit_commit_manually(commit: ConventionalCommit) -> ConventionalCommi
     Returns:
         ConventionalCommit: The edited commit.
     """
+    import questionary
+
     console.print()
-    new_title = questionary.text(
+    new_title = await questionary.text(
         "Edit title:",
         default=commit.title,
-    ).ask()
+    ).ask_async()
 
-    new_body = questionary.text(
+    new_body = await questionary.text(
         "Edit body:",
         default=commit.body,
         multiline=True,
-    ).ask()
+    ).ask_async()
 
     if new_title and new_body:
         return ConventionalCommit(type=commit.type, title=new_title, body=new_body)
@@ -2,15 +2,60 @@
 Git utility functions for subprocess-based git operations.
 
 Provides wrappers for common git operations with proper error handling.
+
+Read-only queries are memoized per process: lit is a short-lived CLI, so the
+repository state they observe does not change underneath a single run except
+through commit_with_message(), which clears the caches.
 """
 
+import functools
 import glob
+import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterable, Iterator, Optional, Tuple
+
+# Absolute path to git, resolved once so each call skips the PATH search.
+# Windows keeps plain "git": there shutil.which() searches the current
+# directory first and accepts any PATHEXT extension, so a git.bat or
+# git.cmd checked into a repository would be run instead of git.exe.
+_GIT = "git" if sys.platform == "win32" else (shutil.which("git") or "git")
+
+# Matches the per-file header of a unified diff and captures both paths.
+# The lazy first group lets paths containing spaces split on " b/".
+_DIFF_HEADER_RE = re.compile(rb'^diff --git "?a/(.+?)"? "?b/(.+?)"?$', re.M)
+
+# Matches file headers (capturing the destination path) and hunk headers
+_DIFF_METADATA_RE = re.compile(
+    rb'^(?:diff --git "?a/.+?"? "?b/(.+?)"?$|@@ -\d+(?:,\d+)? \+\d+(?:,\d+)? @@)', re.M
+)
+
+# Size of the reads used when streaming git output
+_CHUNK_SIZE = 64 * 1024
+
+# Parses "N files changed, X insertions(+), Y deletions(-)" from --shortstat.
+_SHORTSTAT_RE = re.compile(
+    r"(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?"
+)
+
+
+@dataclass
+class FileDelta:
+    """Per-file summary of a unified diff, without the changed lines."""
+
+    path: str
+    added: int = 0
+    deleted: int = 0
+    hunk_headers: list[str] = field(default_factory=list)
+    byte_offset: int = 0
 
 
+@functools.lru_cache(maxsize=1)
 def is_git_repo() -> bool:
     """
     Check if the current directory is inside a git repository.
@@ -20,9 +65,8 @@ def is_git_repo() -> bool:
     """
     try:
         subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
+            [_GIT, "rev-parse", "--git-dir"],
             capture_output=True,
-            text=True,
             check=True,
         )
         return True
@@ -30,54 +74,377 @@ def is_git_repo() -> bool:
         return False
 
 
-def get_staged_files() -> list[str]:
+def _staged_diff_args(context_lines: int = 1) -> list[str]:
+    """
+    Build the argv for a compact, rename-aware staged diff.
+
+    Histogram diffing is faster than myers on large files; a single line of
+    context and ignoring end-of-line whitespace keep the output small.
+
+    Args:
+        context_lines: Lines of context around each hunk.
+
+    Returns:
+        list[str]: The git command line.
+    """
+    return [
+        _GIT,
+        "diff",
+        "--cached",
+        "--diff-algorithm=histogram",
+        "-M",
+        f"-U{context_lines}",
+        "--ignore-space-at-eol",
+        "--no-color",
+    ]
+
+
+def _iter_git_output(args: list[str], chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Run a git command and yield its stdout in chunks while git is running.
+
+    If the consumer stops iterating early, the git process is terminated.
+    Stderr goes to a temporary file rather than a pipe, so git cannot block
+    on a full stderr pipe while stdout is being read.
+
+    Args:
+        args: The git command line.
+        chunk_size: Maximum size of each yielded chunk.
+
+    Yields:
+        bytes: Consecutive chunks of git's stdout.
+
+    Raises:
+        RuntimeError: If git command fails.
+    """
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=stderr_file)
+        finished = False
+        try:
+            while chunk := proc.stdout.read(chunk_size):
+                yield chunk
+            finished = True
+        finally:
+            if not finished:
+                proc.terminate()
+            proc.stdout.close()
+            returncode = proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+
+    if returncode != 0:
+        message = stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"Failed to run git {' '.join(args[1:3])}: {message}")
+
+
+def _collect_bounded(args: list[str], max_bytes: int) -> bytes:
+    """
+    Collect at most ``max_bytes`` of a git command's stdout.
+
+    Git is stopped as soon as the limit is reached, so oversized output is
+    never fully produced or buffered.
+
+    Args:
+        args: The git command line.
+        max_bytes: Upper bound on the number of bytes returned.
+
+    Returns:
+        bytes: The (possibly truncated) output.
+    """
+    chunks = []
+    size = 0
+    stream = _iter_git_output(args)
+    try:
+        for chunk in stream:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                break
+    finally:
+        stream.close()
+    return b"".join(chunks)[:max_bytes]
+
+
+def iter_staged_diff(context_lines: int = 1, chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Stream the diff of staged changes in byte chunks.
+
+    Args:
+        context_lines: Lines of context around each hunk.
+        chunk_size: Maximum size of each yielded chunk.
+
+    Yields:
+        bytes: Consecutive chunks of the unified diff.
+
+    Raises:
+        RuntimeError: If git command fails.
+    """
+    yield from _iter_git_output(_staged_diff_args(context_lines), chunk_size)
+
+
+def collect_staged_diff(
+    max_bytes: int, context_lines: int = 1
+) -> Optional[Tuple[bytes, list[FileDelta]]]:
+    """
+    Get the diff of staged changes and its metadata, if it fits in ``max_bytes``.
+
+    The diff is summarized by extract_diff_metadata_stream() as it streams
+    in. Git is stopped as soon as the diff outgrows the limit, so oversized
+    diffs are never fully produced or buffered.
+
+    Args:
+        max_bytes: Upper bound on the size of the diff in bytes.
+        context_lines: Lines of context around each hunk.
+
+    Returns:
+        Optional[Tuple[bytes, list[FileDelta]]]: (the unified diff, per-file
+        metadata), or None if the diff is larger than ``max_bytes``.
+
+    Raises:
+        RuntimeError: If git command fails.
+    """
+    kept: list[bytes] = []
+    size = 0
+
+    def _keep_within_limit(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        nonlocal size
+        for chunk in chunks:
+            size += len(chunk)
+            if size > max_bytes:
+                return
+            kept.append(chunk)
+            yield chunk
+
+    stream = iter_staged_diff(context_lines)
+    try:
+        deltas = extract_diff_metadata_stream(_keep_within_limit(stream))
+    finally:
+        stream.close()
+    if size > max_bytes:
+        return None
+    return b"".join(kept), deltas
+
+
+def iter_diff_headers(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Yield file paths from ``diff --git`` headers as diff chunks arrive.
+
+    Only complete lines are scanned; a trailing partial line is carried over
+    to the next chunk. Only each new chunk is searched for its last newline,
+    so a long line spread over many chunks is joined once.
+
+    Args:
+        chunks: Consecutive chunks of a unified diff.
+
+    Yields:
+        str: The destination path of each file in the diff.
+    """
+    # Pieces of the current partial line
+    pending: list[bytes] = []
+    for chunk in chunks:
+        cut = chunk.rfind(b"\n") + 1
+        if not cut:
+            pending.append(chunk)
+            continue
+        lines = b"".join(pending) + chunk[:cut]
+        for match in _DIFF_HEADER_RE.finditer(lines):
+            yield match.group(2).decode("utf-8", errors="replace")
+        pending = [chunk[cut:]]
+    for match in _DIFF_HEADER_RE.finditer(b"".join(pending)):
+        yield match.group(2).decode("utf-8", errors="replace")
+
+
+def extract_diff_metadata(diff: bytes) -> list[FileDelta]:
+    """
+    Summarize a unified diff by file without keeping its changed lines.
+
+    Args:
+        diff: The unified diff.
+
+    Returns:
+        list[FileDelta]: One entry per file, in diff order.
+    """
+    return extract_diff_metadata_stream((diff,))
+
+
+def extract_diff_metadata_stream(chunks: Iterable[bytes]) -> list[FileDelta]:
+    """
+    Summarize a unified diff by file as its chunks arrive.
+
+    Only file and hunk headers are matched; added/deleted counts are taken
+    with ``bytes.count`` over each file's hunks. ``byte_offset`` records where
+    each file starts so the full section can be re-parsed on demand.
+
+    Chunks are scanned up to their last newline, which is carried over to
+    the next chunk so every ``\\n+``/``\\n-`` pair is counted exactly once.
+    Only each new chunk is searched for that newline, so a long line spread
+    over many chunks is joined once rather than rescanned per chunk.
+
+    Args:
+        chunks: Consecutive chunks of a unified diff.
+
+    Returns:
+        list[FileDelta]: One entry per file, in diff order.
+    """
+    deltas: list[FileDelta] = []
+    # Whether the scan is inside the hunks of deltas[-1]
+    in_hunks = False
+
+    def _scan(segment: bytes, base: int) -> None:
+        nonlocal in_hunks
+        count_from = 0 if in_hunks else -1
+
+        def _count_lines(end: int) -> None:
+            if count_from >= 0:
+                deltas[-1].added += segment.count(b"\n+", count_from, end)
+                deltas[-1].deleted += segment.count(b"\n-", count_from, end)
+
+        for match in _DIFF_METADATA_RE.finditer(segment):
+            path = match.group(1)
+            if path is not None:
+                _count_lines(match.start())
+                deltas.append(
+                    FileDelta(
+                        path=path.decode("utf-8", errors="replace"),
+                        byte_offset=base + match.start(),
+                    )
+                )
+                count_from = -1
+            elif deltas:
+                deltas[-1].hunk_headers.append(match.group(0).decode("ascii"))
+                if count_from < 0:
+                    count_from = match.end()
+        _count_lines(len(segment))
+        in_hunks = count_from >= 0
+
+    # Pieces of the current partial line, starting at its leading newline
+    pending: list[bytes] = []
+    offset = 0
+    for chunk in chunks:
+        cut = chunk.rfind(b"\n")
+        if cut == -1:
+            pending.append(chunk)
+            continue
+        segment = b"".join(pending) + chunk[:cut]
+        if segment:
+            _scan(segment, offset)
+        offset += len(segment)
+        pending = [chunk[cut:]]
+    segment = b"".join(pending)
+    if segment:
+        _scan(segment, offset)
+    return deltas
+
+
+def format_diff_metadata(deltas: list[FileDelta]) -> str:
+    """
+    Render diff metadata as a compact, human-readable summary.
+
+    Args:
+        deltas: The per-file metadata from extract_diff_metadata().
+
+    Returns:
+        str: One line per file with its counts, followed by its hunk headers.
     """
-    Get list of staged files.
+    lines = []
+    for delta in deltas:
+        lines.append(f"{delta.path} (+{delta.added} -{delta.deleted})")
+        lines.extend(f"  {header}" for header in delta.hunk_headers)
+    return "\n".join(lines)
+
+
+def parse_shortstat(output: str) -> Tuple[int, int, int]:
+    """
+    Parse the output of ``git diff --shortstat``.
+
+    Args:
+        output: The shortstat line, e.g. " 3 files changed, 12 insertions(+)".
 
     Returns:
-        list[str]: List of file paths that are staged for commit.
+        Tuple[int, int, int]: (files changed, insertions, deletions).
+    """
+    match = _SHORTSTAT_RE.search(output)
+    if not match:
+        return 0, 0, 0
+    files, insertions, deletions = match.groups()
+    return int(files), int(insertions or 0), int(deletions or 0)
+
+
+@functools.lru_cache(maxsize=1)
+def get_staged_diff_summary() -> Tuple[int, int, int]:
+    """
+    Get the size of the staged changes without materializing the diff.
+
+    Returns:
+        Tuple[int, int, int]: (files changed, insertions, deletions).
 
     Raises:
         RuntimeError: If git command fails.
     """
     try:
         result = subprocess.run(
-            ["git", "diff", "--cached", "--name-only"],
+            [_GIT, "diff", "--cached", "--shortstat"],
             capture_output=True,
-            text=True,
             check=True,
         )
-        return [f for f in result.stdout.strip().split("\n") if f]
+        return parse_shortstat(result.stdout.decode("ascii", errors="replace"))
     except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to get staged files: {e.stderr}")
+        stderr = e.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"Failed to get staged diff summary: {stderr}")
 
 
-def get_staged_diff() -> str:
+def get_compact_staged_diff(max_bytes: int = 1_000_000) -> Tuple[bytes, str]:
     """
-    Get the diff of staged changes.
+    Get a compact representation of large staged changes.
+
+    Combines the per-file ``--stat`` overview with a zero-context diff of
+    modified files only, truncated to ``max_bytes``.
+
+    Args:
+        max_bytes: Upper bound on the size of the returned diff.
 
     Returns:
-        str: The unified diff of staged changes.
+        Tuple[bytes, str]: (the stat overview followed by the compact diff,
+        the stat overview alone, which lists every staged file)
 
     Raises:
         RuntimeError: If git command fails.
     """
     try:
-        result = subprocess.run(
-            ["git", "diff", "--cached"],
+        stat = subprocess.run(
+            [_GIT, "diff", "--cached", "--stat"],
             capture_output=True,
-            text=True,
             check=True,
         )
-        return result.stdout
     except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to get staged diff: {e.stderr}")
+        stderr = e.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"Failed to get compact staged diff: {stderr}")
+
+    header = stat.stdout[:max_bytes] + b"\n"
+    diff = _collect_bounded(
+        [_GIT, "diff", "--cached", "-U0", "--diff-filter=M"],
+        max(max_bytes - len(header), 0),
+    )
+    return header + diff, stat.stdout.decode("utf-8", errors="replace")
+
+
+def clear_git_caches() -> None:
+    """Drop memoized results of the read-only git queries."""
+    for func in (
+        is_git_repo,
+        get_staged_diff_summary,
+        get_git_root,
+    ):
+        func.cache_clear()
 
 
 def commit_with_message(title: str, body: str) -> bool:
     """
     Commit with a title and body following Conventional Commits format.
 
+    The message is piped to ``git commit -F -`` rather than passed as
+    arguments, so long bodies are not subject to command-line length limits.
+
     Args:
         title: The commit title (e.g., "fix: correct login validation").
         body: The commit body (multiline explanation).
@@ -87,9 +454,11 @@ def commit_with_message(title: str, body: str) -> bool:
     """
     try:
         subprocess.run(
-            ["git", "commit", "-m", title, "-m", body],
+            [_GIT, "commit", "-F", "-"],
+            input=f"{title}\n\n{body}\n".encode("utf-8"),
             check=True,
         )
+        clear_git_caches()
         return True
     except subprocess.CalledProcessError as e:
         return False
@@ -104,8 +473,12 @@ def passthrough_git_command() -> int:
     
     Handles glob patterns (e.g., README*, *.py) by expanding them.
 
+    On POSIX the current process is replaced with git via ``os.execvp``, so
+    there is no child to fork and wait for and this function only returns
+    if git cannot be started. On Windows git runs as a subprocess.
+
     Returns:
-        int: The exit code from the git command.
+        int: The exit code from the git command, or 1 if git is missing.
     """
     args = sys.argv[1:]
     
@@ -125,8 +498,10 @@ def passthrough_git_command() -> int:
             expanded_args.append(arg)
     
     try:
-        result = subprocess.run(["git"] + expanded_args)
-        return result.returncode
+        if sys.platform == "win32":
+            result = subprocess.run([_GIT] + expanded_args)
+            return result.returncode
+        os.execvp(_GIT, ["git"] + expanded_args)
     except FileNotFoundError:
         print(
             "Error: git is not installed or not in PATH. "
@@ -136,6 +511,46 @@ def passthrough_git_command() -> int:
         return 1
 
 
+def start_repo_probe() -> Optional[subprocess.Popen]:
+    """
+    Start locating the repository root in the background.
+
+    Lets git run while the caller does other work (e.g. imports); collect
+    the result with finish_repo_probe().
+
+    Returns:
+        Optional[subprocess.Popen]: The running probe, or None if git is missing.
+    """
+    try:
+        return subprocess.Popen(
+            [_GIT, "rev-parse", "--show-toplevel", "--is-inside-work-tree"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        return None
+
+
+def finish_repo_probe(probe: subprocess.Popen) -> Optional[Path]:
+    """
+    Wait for a probe from start_repo_probe() and return its result.
+
+    Args:
+        probe: The running probe.
+
+    Returns:
+        Optional[Path]: Path to git root directory, or None if not in a work tree.
+    """
+    stdout, _ = probe.communicate()
+    if probe.returncode != 0:
+        return None
+    lines = stdout.splitlines()
+    if len(lines) < 2 or lines[1] != b"true":
+        return None
+    return Path(os.fsdecode(lines[0]))
+
+
+@functools.lru_cache(maxsize=1)
 def get_git_root() -> Optional[Path]:
     """
     Get the root directory of the git repository.
@@ -145,11 +560,10 @@ def get_git_root() -> Optional[Path]:
     """
     try:
         result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
+            [_GIT, "rev-parse", "--show-toplevel"],
             capture_output=True,
-            text=True,
             check=True,
         )
-        return Path(result.stdout.strip())
+        return Path(os.fsdecode(result.stdout.strip()))
     except subprocess.CalledProcessError:
         return None
@@ -6,24 +6,107 @@ and analyze diffs for generating properly formatted Conventional Commits.
 """
 
 import asyncio
+import functools
 import json
 import os
 import re
+import unicodedata
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 try:
-    from lingodotdev import LingoDotDevEngine
+    import simdjson
 except ImportError:
-    LingoDotDevEngine = None  # type: ignore
+    simdjson = None  # type: ignore
+
+# orjson decodes in C and is used when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError, so callers handle a single error type.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Reusable SIMD JSON parser, preferred over _json_loads when installed
+_SIMDJSON_PARSER = simdjson.Parser() if simdjson is not None else None
+
+_COMMIT_FIELDS = ("type", "title", "body")
+# Quoted key names every valid response object must contain
+_COMMIT_FIELD_KEYS = tuple(f'"{key}"' for key in _COMMIT_FIELDS)
+_COMMIT_FIELD_KEYS_BYTES = tuple(key.encode("ascii") for key in _COMMIT_FIELD_KEYS)
+
+# Characters that change brace depth or open a string outside string literals
+_JSON_STRUCTURAL_RE = re.compile(r'[{}"]')
+_JSON_STRUCTURAL_BYTES_RE = re.compile(rb'[{}"]')
+
+# Shared Lingo engine, reused across translations in the same process
+_engine = None
+_engine_lock: Optional[asyncio.Lock] = None
+
+_MAX_TITLE_LENGTH = 72
+
+_ZERO_WIDTH_JOINER = "\u200d"
+# Combining marks (e.g. Devanagari vowel signs) attach to the preceding character
+_COMBINING_CATEGORIES = frozenset({"Mn", "Mc", "Me"})
+# Canonical combining class of viramas, which join consonants into conjuncts
+_VIRAMA_CLASS = 9
+# Emoji skin-tone modifiers attach to the preceding emoji
+_EMOJI_MODIFIERS = ("\U0001f3fb", "\U0001f3ff")
+# Flags are pairs of regional indicator symbols
+_REGIONAL_INDICATORS = ("\U0001f1e6", "\U0001f1ff")
+
+_VALID_TYPES: frozenset[str] = frozenset(
+    {"feat", "fix", "refactor", "docs", "chore", "test", "perf"}
+)
+
+# Keyword categories used by the fallback heuristic, highest priority first.
+# Matching case-insensitively avoids lowercasing a copy of a potentially
+# large diff.
+_MESSAGE_KEYWORDS = (
+    ("fix", r"fix|bug|issue|correct|resolve"),
+    ("feat", r"feat|new|add|feature"),
+)
+_DIFF_KEYWORDS = (
+    ("feat", r"new file:"),
+    ("chore", r"whitespace|formatting|style"),
+)
+
+
+def _compile_keyword_tiers(categories: tuple[tuple[str, str], ...]) -> tuple[re.Pattern, ...]:
+    """
+    Compile one alternation per priority tier.
+
+    ``tiers[k]`` matches the ``k + 1`` highest-priority categories, each as a
+    named group numbered by its rank.
+    """
+    return tuple(
+        re.compile(
+            "|".join(f"(?P<{name}>{keywords})" for name, keywords in categories[: k + 1]),
+            re.IGNORECASE,
+        )
+        for k in range(len(categories))
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def build_fallback_classifier() -> Tuple[Tuple[re.Pattern, ...], Tuple[re.Pattern, ...]]:
+    """
+    Build the keyword tiers used by fallback_generate_commit().
 
+    Compiled on first use and then shared, so importing this module does
+    not pay for patterns that are only needed when the SDK fails.
 
-@dataclass
+    Returns:
+        Tuple: (message tiers, diff tiers) for _classify_keywords().
+    """
+    return (
+        _compile_keyword_tiers(_MESSAGE_KEYWORDS),
+        _compile_keyword_tiers(_DIFF_KEYWORDS),
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class ConventionalCommit:
     """Represents a Conventional Commit with type, title, and body."""
 
@@ -38,8 +121,9 @@ class ConventionalCommit:
         Returns:
             Tuple[str, str]: (formatted_title, formatted_body)
         """
-        formatted_title = f"{self.type}: {self.title}"
-        return formatted_title, self.body
+        # A single f-string compiles to one BUILD_STRING op, which measured
+        # faster than ": ".join((type, title)) for this two-part title.
+        return f"{self.type}: {self.title}", self.body
 
 
 def validate_conventional_commit_type(commit_type: str) -> bool:
@@ -52,8 +136,7 @@ def validate_conventional_commit_type(commit_type: str) -> bool:
     Returns:
         bool: True if valid, False otherwise.
     """
-    allowed_types = {"feat", "fix", "refactor", "docs", "chore", "test", "perf"}
-    return commit_type.lower() in allowed_types
+    return commit_type.lower() in _VALID_TYPES
 
 
 def validate_conventional_commit_title(title: str) -> bool:
@@ -64,16 +147,114 @@ def validate_conventional_commit_title(title: str) -> bool:
         title: The title to validate.
 
     Returns:
-        bool: True if valid (under 72 chars, no trailing period), False otherwise.
+        bool: True if valid (1-72 chars on a single line, no trailing period),
+        False otherwise.
     """
-    if len(title) > 72:
+    if not title:
         return False
-    if title.endswith("."):
-        return False
-    return True
+    # One flat expression on purpose: every rule is a constant-time check
+    # except the newline scan, which runs last and only on short titles.
+    return len(title) <= _MAX_TITLE_LENGTH and title[-1] != "." and "\n" not in title
+
+
+def _find_json_object(text: Union[str, bytes]) -> Optional[Tuple[int, int]]:
+    """
+    Locate the first complete JSON object in text with surrounding prose.
+
+    Walks forward from the first ``{`` tracking brace depth, so the match is
+    found in a single linear pass without regex backtracking. Only structural
+    characters are visited in Python: string literals are skipped by jumping
+    to their closing quote with find(), and the regex engine skips ahead
+    between structural characters outside them.
+
+    Args:
+        text: The text to scan, as str or UTF-8 bytes.
+
+    Returns:
+        Optional[Tuple[int, int]]: (start, end) slice bounds of the object,
+        or None if no balanced object is found.
+    """
+    # Indexing bytes yields ints, so compare against byte values there.
+    # Structural characters are ASCII and never occur inside a UTF-8
+    # multi-byte sequence, so byte offsets are safe slice bounds.
+    if isinstance(text, bytes):
+        structural = _JSON_STRUCTURAL_BYTES_RE
+        open_brace, quote, backslash = b'{"\\'
+    else:
+        structural = _JSON_STRUCTURAL_RE
+        open_brace, quote, backslash = '{"\\'
 
+    start = text.find(open_brace)
+    if start == -1:
+        return None
+
+    depth = 0
+    pos = start
+    while True:
+        match = structural.search(text, pos)
+        if match is None:
+            return None
+        pos = match.start()
+        char = text[pos]
+        if char == quote:
+            # A quote closes the string unless preceded by an odd run of backslashes
+            end = pos
+            while True:
+                end = text.find(quote, end + 1)
+                if end == -1:
+                    return None
+                run_start = end
+                while text[run_start - 1] == backslash:
+                    run_start -= 1
+                if (end - run_start) % 2 == 0:
+                    break
+            pos = end + 1
+        elif char == open_brace:
+            depth += 1
+            pos += 1
+        else:
+            depth -= 1
+            pos += 1
+            if depth == 0:
+                return start, pos
+
+
+def _load_commit_fields(json_text: Union[str, bytes]) -> dict:
+    """
+    Decode a JSON object and return its Conventional Commit fields.
+
+    Uses the shared simdjson parser when available and reads the fields
+    straight off its lazy document. Falls back to _json_loads when simdjson
+    is missing or its parser is still referenced by an earlier document.
+
+    Args:
+        json_text: Text of a single JSON object, as str or UTF-8 bytes.
+            Bytes are handed to the decoder without re-encoding.
 
-def parse_lingo_response(response: str) -> Optional[ConventionalCommit]:
+    Returns:
+        dict: The subset of "type", "title" and "body" present in the object.
+
+    Raises:
+        ValueError: If the text is not valid JSON.
+    """
+    if _SIMDJSON_PARSER is not None:
+        try:
+            raw = json_text if isinstance(json_text, bytes) else json_text.encode("utf-8")
+            doc = _SIMDJSON_PARSER.parse(raw)
+        except RuntimeError:
+            doc = None
+        if isinstance(doc, simdjson.Object):
+            return {key: doc.get(key) for key in _COMMIT_FIELDS if key in doc}
+        if doc is not None:
+            return {}
+
+    data = _json_loads(json_text)
+    if not isinstance(data, dict):
+        return {}
+    return {key: data[key] for key in _COMMIT_FIELDS if key in data}
+
+
+def parse_lingo_response(response: Union[str, bytes]) -> Optional[ConventionalCommit]:
     """
     Parse the Lingo SDK response and extract Conventional Commit data.
 
@@ -84,31 +265,59 @@ def parse_lingo_response(response: str) -> Optional[ConventionalCommit]:
             "body": "detailed explanation"
         }
 
+    Results are cached on the stripped response, so re-parsing an identical
+    response (e.g. when a commit is retried) is a dictionary lookup.
+
     Args:
-        response: The raw response string from Lingo SDK.
+        response: The raw response from Lingo SDK, as str or UTF-8 bytes.
+
+    Returns:
+        Optional[ConventionalCommit]: Parsed commit, or None if parsing fails.
+    """
+    try:
+        key = response.strip()
+    except AttributeError:
+        return None
+    return _parse_lingo_response_cached(key)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_lingo_response_cached(response: Union[str, bytes]) -> Optional[ConventionalCommit]:
+    """
+    Parse a stripped Lingo response; see parse_lingo_response().
+
+    Args:
+        response: The stripped response, as str or UTF-8 bytes.
 
     Returns:
         Optional[ConventionalCommit]: Parsed commit, or None if parsing fails.
     """
     try:
         # Try to extract JSON from the response (may have surrounding text)
-        json_match = re.search(r"\{.*\}", response, re.DOTALL)
-        if not json_match:
+        bounds = _find_json_object(response)
+        if bounds is None:
+            return None
+
+        start, end = bounds
+        json_text = response[start:end]
+
+        # Reject objects that cannot hold every field before decoding them
+        keys = _COMMIT_FIELD_KEYS_BYTES if isinstance(json_text, bytes) else _COMMIT_FIELD_KEYS
+        if not all(key in json_text for key in keys):
             return None
 
-        json_str = json_match.group(0)
-        data = json.loads(json_str)
+        data = _load_commit_fields(json_text)
 
         # Validate required fields
-        if not all(k in data for k in ["type", "title", "body"]):
+        if len(data) != len(_COMMIT_FIELDS):
             return None
 
         commit_type = data.get("type", "").lower()
         title = data.get("title", "").strip()
         body = data.get("body", "").strip()
 
-        # Validate constraints
-        if not validate_conventional_commit_type(commit_type):
+        # Validate constraints (commit_type is already lowercased)
+        if commit_type not in _VALID_TYPES:
             return None
         if not validate_conventional_commit_title(title):
             return None
@@ -116,12 +325,50 @@ def parse_lingo_response(response: str) -> Optional[ConventionalCommit]:
             return None
 
         return ConventionalCommit(type=commit_type, title=title, body=body)
-    except json.JSONDecodeError:
+    except ValueError:
+        # Invalid JSON (json, orjson and simdjson all raise ValueError subclasses)
         return None
     except (KeyError, AttributeError, TypeError):
         return None
 
 
+async def get_engine(api_key: str):
+    """
+    Get the shared Lingo engine, creating it on first use.
+
+    Reusing one engine keeps its HTTP client (and TLS connection) alive
+    across translations instead of reconnecting per call; the engine opens
+    the client itself on its first request. Callers must await
+    close_engine() before their event loop shuts down.
+
+    Args:
+        api_key: The Lingo.dev API key used when the engine is created.
+
+    Returns:
+        LingoDotDevEngine: The shared engine.
+    """
+    global _engine, _engine_lock
+
+    if _engine_lock is None:
+        _engine_lock = asyncio.Lock()
+
+    async with _engine_lock:
+        if _engine is None:
+            from lingodotdev import LingoDotDevEngine
+
+            _engine = LingoDotDevEngine({"api_key": api_key})
+    return _engine
+
+
+async def close_engine() -> None:
+    """Close the shared Lingo engine, if one was opened."""
+    global _engine
+
+    if _engine is not None:
+        engine, _engine = _engine, None
+        await engine.close()
+
+
 async def translate_commit_message(
     raw_message: str, staged_diff: str
 ) -> Optional[ConventionalCommit]:
@@ -145,6 +392,12 @@ async def translate_commit_message(
         RuntimeError: If LINGODOTDEV_API_KEY is missing or SDK call fails.
         ValueError: If SDK parameters are invalid.
     """
+    # Imported here so that validation and fallback helpers stay cheap to import
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file
+    load_dotenv()
+
     api_key = os.environ.get("LINGODOTDEV_API_KEY")
     if not api_key:
         raise RuntimeError(
@@ -152,11 +405,13 @@ async def translate_commit_message(
             "Please set it to use the commit translation feature."
         )
 
-    if LingoDotDevEngine is None:
+    try:
+        import lingodotdev  # noqa: F401
+    except ImportError as e:
         raise RuntimeError(
             "lingodotdev package is not installed. "
             "Install it with: pip install lingodotdev"
-        )
+        ) from e
 
     # System instruction embedded in the content
     system_instruction = (
@@ -179,29 +434,29 @@ async def translate_commit_message(
     }
 
     try:
-        async with LingoDotDevEngine({"api_key": api_key}) as engine:
-            result = await engine.localize_object(
-                content,
-                {
-                    "source_locale": None,
-                    "target_locale": "en",
-                    "fast": False,
-                },
-            )
-
-            # Extract the translated content
-            if hasattr(result, "translated"):
-                translated_str = result.translated
-            elif isinstance(result, str):
-                translated_str = result
-            elif isinstance(result, dict):
-                translated_str = result.get("translated", str(result))
-            else:
-                translated_str = str(result)
-
-            # Parse the response
-            commit = parse_lingo_response(translated_str)
-            return commit
+        engine = await get_engine(api_key)
+        result = await engine.localize_object(
+            content,
+            {
+                "source_locale": None,
+                "target_locale": "en",
+                "fast": False,
+            },
+        )
+
+        # Extract the translated content
+        if hasattr(result, "translated"):
+            translated_str = result.translated
+        elif isinstance(result, str):
+            translated_str = result
+        elif isinstance(result, dict):
+            translated_str = result.get("translated", str(result))
+        else:
+            translated_str = str(result)
+
+        # Parse the response
+        commit = parse_lingo_response(translated_str)
+        return commit
 
     except ValueError as e:
         raise ValueError(f"Invalid parameters for Lingo SDK: {e}") from e
@@ -211,6 +466,82 @@ async def translate_commit_message(
         raise RuntimeError(f"Unexpected error during translation: {e}") from e
 
 
+def _classify_keywords(tiers: tuple[re.Pattern, ...], text: str) -> Optional[str]:
+    """
+    Return the highest-priority commit type whose keywords occur in text.
+
+    The first hit of any category is found with one search. After that,
+    only higher-priority tiers are searched for, starting just after the
+    current hit begins, so the scan runs in C and Python handles at most
+    one match per category. A higher-priority keyword cannot begin at the
+    same position, since alternatives are tried in priority order.
+
+    Args:
+        tiers: Patterns from _compile_keyword_tiers().
+        text: The text to scan.
+
+    Returns:
+        Optional[str]: The winning commit type, or None if nothing matched.
+    """
+    match = tiers[-1].search(text)
+    while match is not None and match.lastindex > 1:
+        better = tiers[match.lastindex - 2].search(text, match.start() + 1)
+        if better is None:
+            break
+        match = better
+    return match.lastgroup if match is not None else None
+
+
+def _is_regional_indicator(char: str) -> bool:
+    """Return whether char is one half of a flag emoji."""
+    return _REGIONAL_INDICATORS[0] <= char <= _REGIONAL_INDICATORS[1]
+
+
+def _splits_flag(text: str, cut: int) -> bool:
+    """
+    Return whether cutting text at ``cut`` separates the halves of a flag.
+
+    Regional indicators pair up from the start of their run, so the cut
+    falls inside a flag when an odd number of them precede it.
+    """
+    if not _is_regional_indicator(text[cut]):
+        return False
+    start = cut
+    while start > 0 and _is_regional_indicator(text[start - 1]):
+        start -= 1
+    return (cut - start) % 2 == 1
+
+
+def _truncate_text(text: str, limit: int) -> str:
+    """
+    Cut text to at most ``limit`` characters without splitting a grapheme.
+
+    Backs off past combining marks, zero-width joiners, emoji modifiers,
+    virama conjuncts and flag pairs so scripts like Devanagari are not left
+    with a dangling vowel sign.
+
+    Args:
+        text: The text to truncate.
+        limit: Maximum number of characters to keep.
+
+    Returns:
+        str: The truncated text.
+    """
+    if len(text) <= limit:
+        return text
+
+    cut = limit
+    while cut > 0 and (
+        unicodedata.category(text[cut]) in _COMBINING_CATEGORIES
+        or _EMOJI_MODIFIERS[0] <= text[cut] <= _EMOJI_MODIFIERS[1]
+        or _ZERO_WIDTH_JOINER in (text[cut], text[cut - 1])
+        or unicodedata.combining(text[cut - 1]) == _VIRAMA_CLASS
+        or _splits_flag(text, cut)
+    ):
+        cut -= 1
+    return text[:cut]
+
+
 def fallback_generate_commit(
     raw_message: str, staged_diff: str
 ) -> ConventionalCommit:
@@ -220,7 +551,7 @@ def fallback_generate_commit(
     Uses simple keyword matching on the message and diff:
     - If "fix" keywords present → type = fix
     - If new files added → feat
-    - If only formatting changes → chore
+    - If formatting keywords appear in the diff → chore
     - Default → refactor
 
     Args:
@@ -230,28 +561,16 @@ def fallback_generate_commit(
     Returns:
         ConventionalCommit: A best-effort generated commit.
     """
-    message_lower = raw_message.lower()
-    diff_lower = staged_diff.lower()
-
-    # Detect type based on keywords
-    if any(
-        keyword in message_lower
-        for keyword in ["fix", "bug", "issue", "correct", "resolve"]
-    ):
-        commit_type = "fix"
-    elif any(keyword in message_lower for keyword in ["feat", "new", "add", "feature"]):
-        commit_type = "feat"
-    elif "new file:" in diff_lower:
-        commit_type = "feat"
-    elif all(
-        keyword in diff_lower for keyword in ["whitespace", "formatting", "style"]
-    ):
-        commit_type = "chore"
-    else:
-        commit_type = "refactor"
+    # Detect type based on keywords; the message takes precedence over the diff
+    message_tiers, diff_tiers = build_fallback_classifier()
+    commit_type = (
+        _classify_keywords(message_tiers, raw_message)
+        or _classify_keywords(diff_tiers, staged_diff)
+        or "refactor"
+    )
 
     # Create a basic title from the message
-    title = raw_message[:70] if len(raw_message) <= 70 else raw_message[:67] + "..."
+    title = raw_message if len(raw_message) <= 70 else _truncate_text(raw_message, 67) + "..."
     # Remove any type prefix if user included it
     if ":" in title:
         title = title.split(":", 1)[-1].strip()
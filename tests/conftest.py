@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the lit test suite.
+"""
+
+import pytest
+
+from lit.lingo_utils import ConventionalCommit, build_fallback_classifier
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fallback_classifier():
+    """
+    Build the fallback keyword classifier once for the whole session.
+
+    Keeps the one-time pattern compilation out of individual test timings.
+    """
+    return build_fallback_classifier()
+
+
+@pytest.fixture(scope="session")
+def make_commit():
+    """
+    Factory for ConventionalCommit instances with sensible defaults.
+
+    Session-scoped so the factory is built once; tests pass only the fields
+    they care about.
+    """
+
+    def _make_commit(
+        type: str = "feat", title: str = "add feature", body: str = "details"
+    ) -> ConventionalCommit:
+        return ConventionalCommit(type=type, title=title, body=body)
+
+    return _make_commit
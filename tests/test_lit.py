@@ -3,47 +3,77 @@ Example test suite for lit CLI.
 
 This demonstrates how to test the lit CLI components.
 Run with: pytest tests/test_lit.py -v
+Benchmarks: pytest tests/test_lit.py -m slow --benchmark-only
 """
 
+import sys
+from pathlib import Path
+
 import pytest
 from lit.lingo_utils import (
-    ConventionalCommit,
+    _parse_lingo_response_cached,
     parse_lingo_response,
     validate_conventional_commit_type,
     validate_conventional_commit_title,
     fallback_generate_commit,
 )
+from lit.git_utils import (
+    _iter_git_output,
+    extract_diff_metadata,
+    extract_diff_metadata_stream,
+    iter_diff_headers,
+    parse_shortstat,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+_VALID_TYPES = ("feat", "fix", "refactor", "docs", "chore", "test", "perf")
+_INVALID_TYPES = ("feature", "bug", "update", "wip", "hotfix")
 
 
 class TestConventionalCommitValidation:
     """Tests for Conventional Commit validation."""
 
-    def test_valid_commit_type(self):
+    @pytest.mark.parametrize("commit_type", _VALID_TYPES)
+    def test_valid_commit_type(self, commit_type):
         """Test valid commit types."""
-        valid_types = ["feat", "fix", "refactor", "docs", "chore", "test", "perf"]
-        for commit_type in valid_types:
-            assert validate_conventional_commit_type(commit_type)
+        assert validate_conventional_commit_type(commit_type)
 
-    def test_invalid_commit_type(self):
+    @pytest.mark.parametrize("commit_type", _INVALID_TYPES)
+    def test_invalid_commit_type(self, commit_type):
         """Test invalid commit types."""
-        invalid_types = ["feature", "bug", "update", "wip", "hotfix"]
-        for commit_type in invalid_types:
-            assert not validate_conventional_commit_type(commit_type)
-
-    def test_commit_title_under_72_chars(self):
-        """Test title under 72 characters is valid."""
-        title = "add validation checks to login"
-        assert validate_conventional_commit_title(title)
-
-    def test_commit_title_over_72_chars(self):
-        """Test title over 72 characters is invalid."""
-        title = "this is a very long commit title that exceeds 72 characters and should fail"
-        assert not validate_conventional_commit_title(title)
-
-    def test_commit_title_with_trailing_period(self):
-        """Test title with trailing period is invalid."""
-        title = "add validation checks."
-        assert not validate_conventional_commit_title(title)
+        assert not validate_conventional_commit_type(commit_type)
+
+    @pytest.mark.parametrize(
+        "title, expected",
+        [
+            # Under 72 characters is valid
+            ("add validation checks to login", True),
+            # Over 72 characters is invalid
+            (
+                "this is a very long commit title that exceeds 72 characters and should fail",
+                False,
+            ),
+            # Trailing period is invalid
+            ("add validation checks.", False),
+            # Exactly 72 characters is valid
+            ("a" * 72, True),
+            # Empty and multi-line titles are invalid
+            ("", False),
+            ("add validation\nchecks", False),
+        ],
+        ids=[
+            "under_72_chars",
+            "over_72_chars",
+            "trailing_period",
+            "exactly_72_chars",
+            "empty",
+            "multiline",
+        ],
+    )
+    def test_commit_title(self, title, expected):
+        """Test commit title length and trailing-period rules."""
+        assert validate_conventional_commit_title(title) is expected
 
 
 class TestJsonParsing:
@@ -51,13 +81,10 @@ class TestJsonParsing:
 
     def test_parse_valid_json_response(self):
         """Test parsing valid Lingo response."""
-        response = """
-        {
-            "type": "fix",
-            "title": "correct login validation logic",
-            "body": "add required field checks\\nresolve null pointer issue"
-        }
-        """
+        response = (
+            b'{"type":"fix","title":"correct login validation logic",'
+            b'"body":"add required field checks\\nresolve null pointer issue"}'
+        )
         commit = parse_lingo_response(response)
         assert commit is not None
         assert commit.type == "fix"
@@ -65,21 +92,62 @@ class TestJsonParsing:
 
     def test_parse_json_with_surrounding_text(self):
         """Test parsing JSON embedded in surrounding text."""
-        response = """
-        Here's the commit:
-        
-        {
-            "type": "feat",
-            "title": "add oauth integration",
-            "body": "implement oauth 2.0 flow"
-        }
-        
-        Done!
-        """
+        response = (
+            b"Here's the commit:\n\n"
+            b'{"type":"feat","title":"add oauth integration","body":"implement oauth 2.0 flow"}'
+            b"\n\nDone!"
+        )
         commit = parse_lingo_response(response)
         assert commit is not None
         assert commit.type == "feat"
 
+    def test_parse_json_with_braces_after_object(self):
+        """Test only the first balanced object is parsed."""
+        response = (
+            'Result: {"type": "fix", "title": "handle {} in names", '
+            '"body": "escape braces"} see also {notes}'
+        )
+        commit = parse_lingo_response(response)
+        assert commit is not None
+        assert commit.title == "handle {} in names"
+
+    @pytest.mark.parametrize("as_bytes", [False, True], ids=["str", "bytes"])
+    @pytest.mark.parametrize(
+        "obj, title, body",
+        [
+            (
+                r'{"type":"fix","title":"quote \"name\" fields","body":"b"}',
+                'quote "name" fields',
+                "b",
+            ),
+            (r'{"type":"fix","title":"trim path\\","body":"b\\"}', "trim path\\", "b\\"),
+            (r'{"type":"fix","title":"keep \\\" pairs","body":"b"}', 'keep \\" pairs', "b"),
+            (
+                r'{"type":"fix","title":"handle { and } in names","body":"close } then {"}',
+                "handle { and } in names",
+                "close } then {",
+            ),
+        ],
+        ids=["escaped_quote", "escaped_backslash_at_end", "backslash_then_quote", "braces"],
+    )
+    def test_parse_json_string_escapes(self, obj, title, body, as_bytes):
+        """Test escapes and braces inside strings do not end the object early."""
+        response = f"Result: {obj} see {{notes}}"
+        commit = parse_lingo_response(response.encode() if as_bytes else response)
+        assert commit is not None
+        assert (commit.title, commit.body) == (title, body)
+
+    def test_parse_cache_ignores_surrounding_whitespace(self):
+        """Test responses differing only in outer whitespace share one cache entry."""
+        _parse_lingo_response_cached.cache_clear()
+        response = '{"type":"docs","title":"describe cache","body":"explain reuse"}'
+        first = parse_lingo_response(f"\n  {response}  \n")
+        second = parse_lingo_response(response)
+        assert first is not None
+        assert second is first
+        info = _parse_lingo_response_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
     def test_parse_invalid_json(self):
         """Test parsing invalid JSON returns None."""
         response = "not valid json"
@@ -94,13 +162,7 @@ class TestJsonParsing:
 
     def test_parse_json_invalid_type(self):
         """Test parsing JSON with invalid type returns None."""
-        response = """
-        {
-            "type": "invalid",
-            "title": "test",
-            "body": "test body"
-        }
-        """
+        response = b'{"type":"invalid","title":"test","body":"test body"}'
         commit = parse_lingo_response(response)
         assert commit is None
 
@@ -129,6 +191,16 @@ class TestFallbackGeneration:
         commit = fallback_generate_commit(message, diff)
         assert commit.type == "chore"
 
+    def test_fallback_prefers_higher_priority_message_keyword(self):
+        """Test a later 'fix' keyword outranks an earlier 'feat' keyword."""
+        commit = fallback_generate_commit("add fix for login", "")
+        assert commit.type == "fix"
+
+    def test_fallback_prefers_higher_priority_diff_keyword(self):
+        """Test a later new file outranks earlier formatting changes."""
+        commit = fallback_generate_commit("tweak layout", "style tweaks\nnew file: x")
+        assert commit.type == "feat"
+
     def test_fallback_default_refactor(self):
         """Test fallback defaults to refactor."""
         message = "some generic change"
@@ -140,9 +212,9 @@ class TestFallbackGeneration:
 class TestConventionalCommitFormatting:
     """Tests for Conventional Commit formatting."""
 
-    def test_format_message_with_type_and_title(self):
+    def test_format_message_with_type_and_title(self, make_commit):
         """Test formatted message includes type and title."""
-        commit = ConventionalCommit(
+        commit = make_commit(
             type="fix",
             title="correct validation logic",
             body="detailed explanation",
@@ -151,16 +223,103 @@ class TestConventionalCommitFormatting:
         assert title == "fix: correct validation logic"
         assert body == "detailed explanation"
 
-    def test_format_preserves_multiline_body(self):
+    def test_format_preserves_multiline_body(self, make_commit):
         """Test formatted message preserves multiline body."""
         body_text = "line 1\nline 2\nline 3"
-        commit = ConventionalCommit(
-            type="feat", title="add feature", body=body_text
-        )
+        commit = make_commit(body=body_text)
         _, body = commit.format_message()
         assert body == body_text
 
 
+class TestGitOutputParsing:
+    """Tests for parsing git command output."""
+
+    def test_parse_shortstat_full(self):
+        """Test shortstat with files, insertions and deletions."""
+        output = " 3 files changed, 12 insertions(+), 4 deletions(-)\n"
+        assert parse_shortstat(output) == (3, 12, 4)
+
+    def test_parse_shortstat_deletions_only(self):
+        """Test shortstat without an insertions clause."""
+        output = " 1 file changed, 1 deletion(-)\n"
+        assert parse_shortstat(output) == (1, 0, 1)
+
+    def test_parse_shortstat_empty(self):
+        """Test empty shortstat means nothing is staged."""
+        assert parse_shortstat("") == (0, 0, 0)
+
+    def test_diff_headers_split_across_chunks(self):
+        """Test file names are recovered when headers span chunk boundaries."""
+        diff = (
+            b"diff --git a/app.py b/app.py\n+print(1)\n"
+            b"diff --git a/old name.txt b/new name.txt\n"
+        )
+        chunks = [diff[i : i + 7] for i in range(0, len(diff), 7)]
+        assert list(iter_diff_headers(chunks)) == ["app.py", "new name.txt"]
+
+    def test_diff_headers_after_long_single_line(self):
+        """Test headers are found after a long line split over many chunks."""
+        diff = (
+            b"diff --git a/app.min.js b/app.min.js\n+" + b"x;" * 500_000 + b"\n"
+            b"diff --git a/app.py b/app.py\n"
+        )
+        chunks = [diff[i : i + 64] for i in range(0, len(diff), 64)]
+        assert list(iter_diff_headers(chunks)) == ["app.min.js", "app.py"]
+
+    def test_git_output_with_large_stderr_does_not_hang(self):
+        """Test a command flooding stderr is reported instead of blocking."""
+        script = "import sys; sys.stderr.write('e' * 1_000_000); sys.exit(1)"
+        with pytest.raises(RuntimeError):
+            list(_iter_git_output([sys.executable, "-c", script]))
+
+    def test_extract_diff_metadata(self):
+        """Test per-file counts and hunk headers are extracted."""
+        diff = (
+            b"diff --git a/app.py b/app.py\n"
+            b"--- a/app.py\n+++ b/app.py\n"
+            b"@@ -1,2 +1,2 @@\n-old\n+new\n+more\n"
+            b"diff --git a/README.md b/README.md\n"
+            b"--- a/README.md\n+++ b/README.md\n"
+            b"@@ -5 +4,0 @@\n-gone\n"
+        )
+        app, readme = extract_diff_metadata(diff)
+        assert (app.path, app.added, app.deleted) == ("app.py", 2, 1)
+        assert app.hunk_headers == ["@@ -1,2 +1,2 @@"]
+        assert app.byte_offset == 0
+        assert (readme.path, readme.added, readme.deleted) == ("README.md", 0, 1)
+        assert diff[readme.byte_offset :].startswith(b"diff --git a/README.md")
+
+    def test_extract_diff_metadata_stream_matches_whole(self):
+        """Test streamed metadata matches the whole-diff result at any chunk size."""
+        diff = (
+            b"diff --git a/app.py b/app.py\n"
+            b"--- a/app.py\n+++ b/app.py\n"
+            b"@@ -1,2 +1,2 @@\n-old\n+new\n@@ -9 +9,2 @@\n+more\n+again\n"
+            b"diff --git a/README.md b/README.md\n"
+            b"--- a/README.md\n+++ b/README.md\n"
+            b"@@ -5 +4,0 @@\n-gone\n"
+        )
+        expected = extract_diff_metadata(diff)
+        for size in (1, 2, 5, 16, len(diff)):
+            chunks = [diff[i : i + size] for i in range(0, len(diff), size)]
+            assert extract_diff_metadata_stream(chunks) == expected
+
+    def test_extract_diff_metadata_stream_long_single_line(self):
+        """Test a long line split over many chunks is counted once."""
+        diff = (
+            b"diff --git a/app.min.js b/app.min.js\n"
+            b"--- /dev/null\n+++ b/app.min.js\n"
+            b"@@ -0,0 +1 @@\n+" + b"x;" * 500_000 + b"\n"
+            b"diff --git a/app.py b/app.py\n"
+            b"@@ -1 +1 @@\n-old\n+new\n"
+        )
+        chunks = [diff[i : i + 64] for i in range(0, len(diff), 64)]
+        bundle, app = extract_diff_metadata_stream(chunks)
+        assert (bundle.path, bundle.added, bundle.deleted) == ("app.min.js", 1, 0)
+        assert (app.path, app.added, app.deleted) == ("app.py", 1, 1)
+        assert diff[app.byte_offset :].startswith(b"diff --git a/app.py")
+
+
 class TestEdgeCases:
     """Tests for edge cases."""
 
@@ -168,7 +327,7 @@ class TestEdgeCases:
         """Test fallback handles empty message."""
         commit = fallback_generate_commit("", "")
         assert commit is not None
-        assert commit.type in ["feat", "fix", "refactor", "docs", "chore", "test", "perf"]
+        assert commit.type in _VALID_TYPES
 
     def test_very_long_message(self):
         """Test fallback truncates very long message."""
@@ -176,6 +335,27 @@ class TestEdgeCases:
         commit = fallback_generate_commit(long_message, "")
         assert len(commit.title) <= 72
 
+    def test_long_unicode_message_keeps_graphemes_whole(self):
+        """Test truncation does not split a Devanagari vowel sign from its consonant."""
+        message = "a" * 66 + "कि" + " बग फिक्स" * 10
+        commit = fallback_generate_commit(message, "")
+        assert len(commit.title) <= 72
+        assert commit.title == "a" * 66 + "..."
+
+    @pytest.mark.parametrize(
+        "prefix, expected",
+        [
+            ("a" * 66, "a" * 66 + "..."),
+            ("a" * 65, "a" * 65 + "\U0001f1ee\U0001f1f3..."),
+        ],
+        ids=["cut_inside_flag", "cut_between_flags"],
+    )
+    def test_long_message_keeps_flags_whole(self, prefix, expected):
+        """Test truncation does not split a flag into lone regional indicators."""
+        message = prefix + "\U0001f1ee\U0001f1f3" * 2 + " flag update"
+        commit = fallback_generate_commit(message, "")
+        assert commit.title == expected
+
     def test_unicode_in_message(self):
         """Test handling of unicode characters."""
         message = "login का bug fix किया"
@@ -184,5 +364,24 @@ class TestEdgeCases:
         assert len(commit.title) > 0
 
 
+class TestParserBenchmark:
+    """Performance regression guard for the Lingo response parser."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.slow
+    def test_parse_bench(self, benchmark):
+        """Benchmark parsing a ~10 KB Lingo payload."""
+        payload = (FIXTURES / "large_lingo.json").read_text(encoding="utf-8")
+
+        def parse_uncached():
+            # Measure the parse itself, not a hit in the response cache
+            _parse_lingo_response_cached.cache_clear()
+            return parse_lingo_response(payload)
+
+        commit = benchmark(parse_uncached)
+        assert commit is not None
+        assert commit.type == "perf"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])